@@ -12,26 +12,32 @@ Outputs (docs/):
 - docs/곰탕지수_1Y리스케일_latest_embedded.html
 - docs/index.html  (Genspark-like shell + latest content)
 - docs/report_index.json  (최근 10개 날짜 목록)
-- docs/assets/*.png
+- docs/assets/*.svg  (라인차트)
+- docs/assets/*.webp  (히트맵)
 """
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
+import os
 from pathlib import Path
 from datetime import datetime
+from typing import TYPE_CHECKING, Callable
 
 import numpy as np
 import pandas as pd
 
-import matplotlib as mpl
-mpl.rcParams["font.family"] = "Noto Sans CJK KR"
-mpl.rcParams["axes.unicode_minus"] = False
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:  # pyarrow 미설치 시 pandas 파서 사용
+    pa = None
+    pacsv = None
 
-import matplotlib
-matplotlib.use("Agg")  # headless
-import matplotlib.pyplot as plt
-import seaborn as sns
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
 
 
 # -----------------------------
@@ -48,6 +54,30 @@ SUMMARY_JSON = DATA_DIR / "summary_last1y_rescaled.json"
 
 REPORT_INDEX_JSON = DOCS_DIR / "report_index.json"
 
+CSV_CACHE_DIR = DATA_DIR / ".cache"
+CSV_CACHE_VERSION = 3
+CSV_CACHE_MAX_AGE_SEC = 7 * 24 * 3600
+
+FG_LINE_MAX_POINTS = 252 * 2
+
+# FG CSV 컬럼
+DATE_COLS = ("날짜", "date", "Date")
+COMPONENT_COLS = ("momentum", "strength", "breadth", "putcall", "volatility", "safe_haven", "junk_bond", "margin_loan_ratio")
+FG_USECOLS = frozenset((
+    *DATE_COLS,
+    "fear_greed_1y_rescaled",
+    "fear_greed",
+    *COMPONENT_COLS,
+    "index_close",
+    "fg_bucket_1y",
+    "fwd_ret_20d_1y",
+))
+FG_BUCKETS = ("Extreme Fear", "Fear", "Neutral", "Greed", "Extreme Greed")
+FG_BUCKET_DTYPE = pd.CategoricalDtype(FG_BUCKETS, ordered=True)
+TREND_BINS = ("↓강", "↓", "→", "↑", "↑강")
+TREND_BIN_DTYPE = pd.CategoricalDtype(TREND_BINS, ordered=True)
+OPINION_LABELS = {1: "매수", 0: "중립", -1: "매도"}
+
 
 # -----------------------------
 # Helpers
@@ -57,75 +87,191 @@ def _ensure_dirs():
     ASSETS_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def _read_fg() -> pd.DataFrame:
+def _read_fg() -> tuple[pd.DataFrame, frozenset[str]]:
+    """
+    FG CSV 로드 + 날짜 정렬
+    - 반환: (df, 값이 하나라도 있는 컬럼 집합)
+    """
     if not FG_CSV.exists():
         raise FileNotFoundError(f"Missing input: {FG_CSV}")
-    df = pd.read_csv(FG_CSV)
-
-    # Raw header confirms '날짜' column exists [Source: raw CSV]
-    if "날짜" in df.columns:
-        df["date"] = pd.to_datetime(df["날짜"])
-    elif "date" in df.columns:
-        df["date"] = pd.to_datetime(df["date"])
-    elif "Date" in df.columns:
-        df["date"] = pd.to_datetime(df["Date"])
+    df = _cached_read_csv(FG_CSV, _parse_fg_csv)
+
+    # 컬럼별 notna().any() 반복 스캔 대신 한 번에 계산 → 이후 헬퍼들은 `c in valid`로 확인
+    nonnull = df.notna().any(axis=0)
+    valid = frozenset(nonnull.index[nonnull.to_numpy()])
+    return df, valid
+
+
+def _parse_fg_csv(path: Path) -> pd.DataFrame:
+    if pacsv is not None:
+        # pyarrow 멀티스레드 파서: 날짜 파싱/컬럼명 변경까지 Arrow 단계에서 처리
+        table = pacsv.read_csv(
+            str(path),
+            read_options=pacsv.ReadOptions(block_size=4 << 20),
+            convert_options=pacsv.ConvertOptions(timestamp_parsers=["%Y-%m-%d"]),
+        )
+        date_col = _find_date_col(table.column_names)
+        table = table.rename_columns(["date" if c == date_col else c for c in table.column_names])
+        if pa.types.is_timestamp(table.schema.field("date").type):
+            # 정렬도 Arrow에서 (to_pandas가 정렬된 배열 + 새 RangeIndex 생성)
+            table = table.sort_by([("date", "ascending")])
+            df = table.to_pandas()
+        else:
+            # %Y-%m-%d 외 형식은 문자열로 남음 → 문자열 정렬 금지, pandas에서 변환 후 정렬
+            df = table.to_pandas()
+            df["date"] = pd.to_datetime(df["date"])
+            df = df.sort_values("date").reset_index(drop=True)
     else:
-        raise ValueError(f"Cannot find date column. Columns={list(df.columns)[:30]}...")
+        # 사용 컬럼만 파싱, 차트 전용 컴포넌트는 float32
+        df = pd.read_csv(
+            path,
+            usecols=lambda c: c in FG_USECOLS,
+            dtype={c: "float32" for c in COMPONENT_COLS},
+        )
+        date_col = _find_date_col(list(df.columns))
+        df["date"] = pd.to_datetime(df[date_col])
+        df = df.sort_values("date").reset_index(drop=True)
+
+    # bucket 문자열 → ordered Categorical (int8 코드, 이후 astype(str) 불필요)
+    if "fg_bucket_1y" in df.columns:
+        df["fg_bucket_1y"] = df["fg_bucket_1y"].astype(FG_BUCKET_DTYPE)
+    return df
+
+
+def _parse_forward_summary_csv(path: Path) -> pd.DataFrame:
+    if pacsv is not None:
+        # 빈 문자열 셀도 결측으로 (pd.read_csv와 동일)
+        return pacsv.read_csv(str(path), convert_options=pacsv.ConvertOptions(strings_can_be_null=True)).to_pandas()
+    return pd.read_csv(path)
+
+
+def _cached_read_csv(path: Path, parse: Callable[[Path], pd.DataFrame]) -> pd.DataFrame:
+    """
+    CSV 파싱 결과를 Feather로 캐시 (data/.cache/)
+    - 키: 파일명 + mtime_ns + size + CSV_CACHE_VERSION (파싱 로직 변경 시 버전 올리기)
+    - pyarrow 없으면 캐시 없이 바로 파싱
+    """
+    if pacsv is None:
+        return parse(path)
+
+    st = path.stat()
+    key = hashlib.sha1(f"{path.name}:{st.st_mtime_ns}:{st.st_size}:{CSV_CACHE_VERSION}".encode("utf-8")).hexdigest()[:16]
+    cache = CSV_CACHE_DIR / f"{path.stem}.{key}.feather"
+    if cache.exists():
+        try:
+            return pd.read_feather(cache)
+        except Exception:
+            pass  # 깨진 캐시는 무시하고 다시 파싱
 
-    df = df.sort_values("date").reset_index(drop=True)
+    df = parse(path)
+    tmp = cache.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        CSV_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # 1주일 넘은 캐시/남은 임시파일 정리 (scandir 1회, DirEntry 이름 필터 + stat 재사용)
+        cutoff = datetime.now().timestamp() - CSV_CACHE_MAX_AGE_SEC
+        with os.scandir(CSV_CACHE_DIR) as it:
+            for e in it:
+                if e.name.endswith((".feather", ".tmp")) and e.stat().st_mtime < cutoff:
+                    Path(e.path).unlink(missing_ok=True)
+        df.to_feather(tmp)
+        os.replace(tmp, cache)
+    except Exception:
+        # 캐시 기록 실패는 무시 (읽기 전용 체크아웃, Feather로 직렬화 불가한 컬럼 등)
+        try:
+            tmp.unlink(missing_ok=True)
+        except OSError:
+            pass
     return df
 
 
-def _safe_col(df: pd.DataFrame, col: str) -> bool:
-    return col in df.columns and df[col].notna().any()
+def _find_date_col(columns: list[str]) -> str:
+    # Raw header confirms '날짜' column exists [Source: raw CSV]
+    for c in DATE_COLS:
+        if c in columns:
+            return c
+    raise ValueError(f"Cannot find date column. Columns={list(columns)[:30]}...")
+
+
+def _has_last(df: pd.DataFrame, col: str) -> bool:
+    # 최신 행 KPI용: 컬럼 전체 대신 마지막 값 1개만 확인
+    return col in df.columns and pd.notna(df[col].iloc[-1])
 
 
 def _fmt_pct(x: float) -> str:
-    if pd.isna(x):
+    # 스칼라 NaN 체크: pd.isna 디스패치 대신 x != x
+    if x is None or x != x:
         return "-"
     return f"{x*100:.2f}%"
 
 
 def _fmt_num(x: float, nd: int = 2) -> str:
-    if pd.isna(x):
+    if x is None or x != x:
         return "-"
     return f"{x:.{nd}f}"
 
 
-def _bucket_order(x: str) -> int:
-    order = {
-        "Extreme Fear": 0,
-        "Fear": 1,
-        "Neutral": 2,
-        "Greed": 3,
-        "Extreme Greed": 4,
-    }
-    return order.get(str(x), 99)
+def _trend_bins(ret: np.ndarray) -> pd.Categorical:
+    """
+    2축 히트맵의 X축(추세) bin
+    - 5D 수익률 기준 5구간: <=-5% / <=-2% / <2% / <5% / 그 이상, NaN은 결측
+    - 행별 Python 호출 없이 경계 비교 합으로 구간 인덱스 계산 → int8 코드 그대로 ordered Categorical
+    """
+    idx = (ret > -0.05).astype(np.int8) + (ret > -0.02) + (ret >= 0.02) + (ret >= 0.05)
+    idx[np.isnan(ret)] = -1
+    return pd.Categorical.from_codes(idx, dtype=TREND_BIN_DTYPE)
 
 
-def _trend_bin(value: float) -> str:
+def _fmt_float_col(vals: np.ndarray) -> list[str]:
     """
-    2축 히트맵의 X축(추세) bin
-    - 5D 수익률 기준 5구간
+    DataFrame.to_html과 같은 실수 열 포맷 (display.precision=6 기준)
+    - 소수 6자리 후 열 전체에서 공통 끝자리 0 제거 (소수점 뒤 최소 1자리)
+    - 0이 아닌 1e-6 미만 값이 있거나, 1e6 초과 값이 있고 길이가 12자를 넘으면 열 전체 지수표기
+    - NaN은 "NaN"
     """
-    if pd.isna(value):
-        return "NA"
-    if value <= -0.05:
-        return "↓강"
-    if value <= -0.02:
-        return "↓"
-    if value < 0.02:
-        return "→"
-    if value < 0.05:
-        return "↑"
-    return "↑강"
+    ok = ~np.isnan(vals)
+    strs = [f"{v:.6f}" for v in vals[ok]]
+    nums = [i for i, x in enumerate(strs) if x[-1].isdigit()]  # inf 제외
+    while nums and all(strs[i].endswith("0") for i in nums):
+        for i in nums:
+            strs[i] = strs[i][:-1]
+    strs = [x + "0" if x.endswith(".") else x for x in strs]
+
+    absv = np.abs(vals[ok])
+    too_long = bool(strs) and max(map(len, strs)) > 12
+    if ((absv < 1e-6) & (absv > 0)).any() or (too_long and (absv > 1e6).any()):
+        strs = [f"{v:.6e}" for v in vals[ok]]
+    it = iter(strs)
+    return [next(it) if m else "NaN" for m in ok]
 
 
 def _read_forward_summary_table_html() -> str:
     if not FWD_SUMMARY_CSV.exists():
         return "<p><b>forward 요약표 파일 없음</b></p>"
-    df = pd.read_csv(FWD_SUMMARY_CSV)
-    return df.to_html(index=False, escape=False)
+    df = _cached_read_csv(FWD_SUMMARY_CSV, _parse_forward_summary_csv)
+
+    # 고정 형태의 작은 표라 DataFrame.to_html 포매터 대신 직접 조립 (escape 없음, 실수 열은 _fmt_float_col)
+    cols = [
+        _fmt_float_col(df[c].to_numpy()) if df[c].dtype.kind == "f" else ["NaN" if pd.isna(v) else str(v) for v in df[c].to_numpy()]
+        for c in df.columns
+    ]
+    head = "".join(f"<th>{c}</th>" for c in df.columns)
+    body = "".join("<tr>" + "".join(f"<td>{v}</td>" for v in row) + "</tr>" for row in zip(*cols))
+    return (
+        '<table border="1" class="dataframe">'
+        f'<thead><tr style="text-align: right;">{head}</tr></thead>'
+        f"<tbody>{body}</tbody>"
+        "</table>"
+    )
+
+
+def _write_fd(path: Path, data: memoryview) -> None:
+    """저수준 fd로 바이트 기록 (같은 버퍼를 여러 파일에 재사용, 텍스트 인코딩/버퍼링 없음)"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
 
 
 def _read_summary_json() -> dict:
@@ -140,34 +286,86 @@ def _read_summary_json() -> dict:
 # -----------------------------
 # Charts
 # -----------------------------
-def _fig_fg_line(df: pd.DataFrame, out_png: Path) -> None:
-    y_col = "fear_greed_1y_rescaled" if _safe_col(df, "fear_greed_1y_rescaled") else "fear_greed"
-    fig, ax = plt.subplots(figsize=(12, 4))
-    ax.plot(df["date"], df[y_col], linewidth=2, color="#4aa3ff")
+_FIG: Figure | None = None
+
+
+@functools.lru_cache(maxsize=None)
+def _mpl():
+    """
+    matplotlib 지연 로드 (입력 누락 등으로 차트까지 가지 않으면 import 생략)
+    - 백엔드/rcParams 설정은 최초 1회만
+    """
+    import matplotlib as mpl
+
+    mpl.use("Agg")  # headless
+    mpl.rcParams["font.family"] = "Noto Sans CJK KR"
+    mpl.rcParams["axes.unicode_minus"] = False
+
+    mpl.rcParams["agg.path.chunksize"] = 10000
+    mpl.rcParams["path.simplify"] = True
+    mpl.rcParams["path.simplify_threshold"] = 1.0
+    # SVG id(clip-path/marker) 고정 → 같은 데이터면 같은 바이트 (docs/ 매일 커밋 시 불필요한 diff 방지)
+    mpl.rcParams["svg.hashsalt"] = "gomtang"
+    return mpl
+
+
+def _get_fig() -> Figure:
+    """
+    프로세스 공용 Figure (pyplot 상태머신 우회)
+    - 최초 1회만 생성, 각 차트 함수가 clear() + 크기 변경 후 재사용
+    """
+    global _FIG
+    if _FIG is None:
+        _mpl()
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        _FIG = Figure()
+        FigureCanvasAgg(_FIG)
+    return _FIG
+
+
+def _fig_fg_line(df: pd.DataFrame, valid: frozenset[str], out_svg: Path, *, fig: Figure) -> None:
+    y_col = "fear_greed_1y_rescaled" if "fear_greed_1y_rescaled" in valid else "fear_greed"
+    fig.clear()
+    fig.set_size_inches(12, 4)
+    ax = fig.add_subplot()
+    # 최근 2년(252*2 거래일)까지만 그리기
+    n = min(len(df), FG_LINE_MAX_POINTS)
+    x = df["date"].to_numpy()[-n:]
+    y = df[y_col].to_numpy(dtype=np.float32)[-n:]
+    ax.plot(x, y, linewidth=2, color="#4aa3ff")
     ax.set_title("곰탕지수(FG) 라인차트", fontsize=13)
     ax.set_xlabel("")
     ax.set_ylabel("FG (0~100)")
     ax.grid(True, alpha=0.25)
     fig.tight_layout()
-    fig.savefig(out_png, dpi=170)
-    plt.close(fig)
+    # 라인차트는 벡터(SVG)로 저장: 래스터화 생략 + 용량 감소 (히트맵은 PNG 유지)
+    fig.savefig(out_svg, format="svg", metadata={"Date": None})
 
 
-def _fig_components_grid(df: pd.DataFrame, out_png: Path) -> None:
-    comps = ["momentum", "strength", "breadth", "putcall", "volatility", "safe_haven", "junk_bond", "margin_loan_ratio"]
-    have = [c for c in comps if _safe_col(df, c)]
+def _fig_components_grid(df: pd.DataFrame, valid: frozenset[str], out_svg: Path, *, fig: Figure) -> None:
+    have = [c for c in COMPONENT_COLS if c in valid]
     if not have:
         return
 
-    last = df.tail(200).copy()
+    # 필요한 컬럼만 projection (tail은 뷰라 copy 불필요)
+    last = df[["date", *have]].tail(200)
     rows = 4
     cols = 2
-    fig, axes = plt.subplots(rows, cols, figsize=(12, 10), sharex=True)
+    fig.clear()
+    fig.set_size_inches(12, 10)
+    axes = fig.subplots(rows, cols, sharex=True)
     axes = axes.flatten()
 
-    for i, c in enumerate(have[: rows * cols]):
+    # 컬럼별 Series 대신 2D float32 배열로 한 번만 꺼내서 열 단위로 그리기
+    have = have[: rows * cols]
+    x = last["date"].to_numpy()
+    Y = last[have].to_numpy(dtype=np.float32)
+
+    for i, c in enumerate(have):
         ax = axes[i]
-        ax.plot(last["date"], last[c], linewidth=1.6, color="#86b7ff")
+        ax.plot(x, Y[:, i], linewidth=1.6, color="#86b7ff")
         ax.set_title(c, fontsize=10)
         ax.grid(True, alpha=0.2)
 
@@ -176,11 +374,10 @@ def _fig_components_grid(df: pd.DataFrame, out_png: Path) -> None:
 
     fig.suptitle("구성요소(컴포넌트) 라인차트", fontsize=13, y=0.995)
     fig.tight_layout()
-    fig.savefig(out_png, dpi=170)
-    plt.close(fig)
+    fig.savefig(out_svg, format="svg", metadata={"Date": None})
 
 
-def _make_heatmap_tables(df: pd.DataFrame):
+def _make_heatmap_tables(df: pd.DataFrame, valid: frozenset[str]):
     """
     히트맵 2개:
     - 평균(20D) 수익률
@@ -188,59 +385,92 @@ def _make_heatmap_tables(df: pd.DataFrame):
     2축: Y=fg_bucket_1y, X=trend_bin(5D 수익률)
     """
     req = ["fg_bucket_1y", "fwd_ret_20d_1y", "index_close"]
-    if not all(_safe_col(df, c) for c in req):
+    if not all(c in valid for c in req):
         return None, None, None
 
-    d = df.copy()
-    d["ret_5d"] = d["index_close"].pct_change(5)
-    d["trend_bin"] = d["ret_5d"].apply(_trend_bin)
-
-    d = d.dropna(subset=["fg_bucket_1y", "trend_bin", "fwd_ret_20d_1y"])
-    d["bucket"] = d["fg_bucket_1y"].astype(str)
-    d["trend_bin"] = d["trend_bin"].astype(str)
-
-    bucket_order = sorted(d["bucket"].unique(), key=_bucket_order)
-    trend_order = ["↓강", "↓", "→", "↑", "↑강"]
-
-    pivot_mean = (
-        d.groupby(["bucket", "trend_bin"])["fwd_ret_20d_1y"]
-        .mean()
-        .unstack("trend_bin")
-        .reindex(index=bucket_order, columns=trend_order)
-    )
-    pivot_win = (
-        d.groupby(["bucket", "trend_bin"])["fwd_ret_20d_1y"]
-        .apply(lambda s: float((s > 0).mean()))
-        .unstack("trend_bin")
-        .reindex(index=bucket_order, columns=trend_order)
+    # 전체 copy 대신 필요한 컬럼만 projection (bucket은 _read_fg에서 ordered Categorical로 로드됨
+    # → groupby 결과가 이미 정렬됨), 5D 수익률은 NumPy로 직접 계산
+    d = df[["fg_bucket_1y", "fwd_ret_20d_1y"]].rename(columns={"fg_bucket_1y": "bucket"})
+    close = df["index_close"].to_numpy(dtype=np.float64)
+    ret_5d = np.full(len(close), np.nan)
+    ret_5d[5:] = close[5:] / close[:-5] - 1.0
+    d["trend_bin"] = _trend_bins(ret_5d)
+    d = d.dropna(subset=["bucket", "trend_bin", "fwd_ret_20d_1y"])
+
+    bucket_order = d["bucket"].cat.remove_unused_categories().cat.categories.tolist()
+    trend_order = list(TREND_BINS)
+
+    # 평균/승률을 groupby 1회로 같이 집계 (키 2개 모두 Categorical int8 코드)
+    d["_win"] = (d["fwd_ret_20d_1y"] > 0).to_numpy(dtype=np.float32)
+    g = d.groupby(["bucket", "trend_bin"], observed=True, sort=False).agg(
+        mean=("fwd_ret_20d_1y", "mean"),
+        win=("_win", "mean"),
     )
+    pivot_mean = g["mean"].unstack("trend_bin").reindex(index=bucket_order, columns=trend_order)
+    pivot_win = g["win"].unstack("trend_bin").reindex(index=bucket_order, columns=trend_order)
 
-    # 최신 셀 위치
-    latest = d.sort_values("date").iloc[-1]
+    # 최신 셀 위치 (df는 date 정렬 상태)
+    latest = d.iloc[-1]
     latest_bucket = str(latest["bucket"])
     latest_trend = str(latest["trend_bin"])
 
     return pivot_mean, pivot_win, (latest_bucket, latest_trend)
 
 
-def _fig_heatmap(pivot: pd.DataFrame, out_png: Path, title: str, fmt: str, center: float | None, latest_cell=None) -> None:
+def _fig_heatmap(pivot: pd.DataFrame, out_img: Path, title: str, fmt: str, center: float | None, latest_cell=None, *, fig: Figure) -> None:
     if pivot is None or pivot.empty:
         return
 
-    fig, ax = plt.subplots(figsize=(12, 6))
-
-    cmap = "RdYlGn" if center is not None else "YlGn"
-    sns.heatmap(
-        pivot,
-        annot=True,
-        fmt=fmt,
+    mpl = _mpl()
+    from matplotlib.colors import ListedColormap, to_rgb
+    from matplotlib.patches import Rectangle
+
+    fig.clear()
+    fig.set_size_inches(12, 6)
+    ax = fig.add_subplot()
+
+    mat = np.ascontiguousarray(pivot.to_numpy(dtype=np.float32))
+    finite = mat[np.isfinite(mat)]
+    vmin = float(finite.min()) if finite.size else 0.0
+    vmax = float(finite.max()) if finite.size else 1.0
+    cmap = mpl.colormaps["RdYlGn" if center is not None else "YlGn"]
+    if center is not None:
+        # center가 컬러맵 중앙에 오도록 컬러맵 구간만 잘라서 사용 (값 범위는 데이터 그대로)
+        vrange = max(vmax - center, center - vmin)
+        lo, hi = (vmin - center + vrange) / (2 * vrange), (vmax - center + vrange) / (2 * vrange)
+        cmap = ListedColormap(cmap(np.linspace(lo, hi, 256)))
+
+    # 셀 = [j, j+1] x [i, i+1], NaN 셀은 마스킹(빈칸), 흰색 셀 경계선
+    mesh = ax.pcolormesh(
+        np.ma.masked_invalid(mat),
         cmap=cmap,
-        center=center,
-        linewidths=0.6,
-        linecolor="#FFFFFF",  # rgba 문자열 금지(에러 방지)
-        cbar=True,
-        ax=ax,
+        vmin=vmin,
+        vmax=vmax,
+        edgecolors="#FFFFFF",
+        linewidth=0.6,
+        rasterized=True,
     )
+    ax.invert_yaxis()
+    cbar = fig.colorbar(mesh, ax=ax)
+    cbar.outline.set_visible(False)
+
+    # 셀 주석: 배경 밝기에 따라 글자색 선택 (NaN 셀은 비워둠)
+    # seaborn relative_luminance와 동일: sRGB 선형화 후 가중합 > .408 이면 진회색(.15), 아니면 흰색
+    for (i, j), v in np.ndenumerate(mat):
+        if not np.isfinite(v):
+            continue
+        rgb = np.asarray(to_rgb(mesh.cmap(mesh.norm(v))))
+        r, g, b = np.where(rgb <= 0.03928, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+        text_color = ".15" if 0.2126 * r + 0.7152 * g + 0.0722 * b > 0.408 else "w"
+        ax.text(j + 0.5, i + 0.5, format(v, fmt), ha="center", va="center", fontsize=10, color=text_color)
+
+    # 축 라벨
+    ax.set_xticks(np.arange(mat.shape[1]) + 0.5, [str(c) for c in pivot.columns])
+    ax.set_yticks(np.arange(mat.shape[0]) + 0.5, [str(r) for r in pivot.index])
+    ax.tick_params(length=0)
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+
     ax.set_title(title, fontsize=13)
     ax.set_xlabel("")
     ax.set_ylabel("FG Bucket")
@@ -251,18 +481,18 @@ def _fig_heatmap(pivot: pd.DataFrame, out_png: Path, title: str, fmt: str, cente
         if rlab in pivot.index and clab in pivot.columns:
             r = list(pivot.index).index(rlab)
             c = list(pivot.columns).index(clab)
-            ax.add_patch(plt.Rectangle((c, r), 1, 1, fill=False, edgecolor="black", linewidth=2.5))
+            ax.add_patch(Rectangle((c, r), 1, 1, fill=False, edgecolor="black", linewidth=2.5, zorder=3))
 
     fig.tight_layout()
-    fig.savefig(out_png, dpi=180)
-    plt.close(fig)
+    # 카드 폭 대비 2배 해상도면 충분 → dpi 110 + 무손실 WebP (PNG 대비 용량 ~1/5)
+    fig.savefig(out_img, dpi=110, format="webp", pil_kwargs={"lossless": True})
 
 
 # -----------------------------
 # Strategy A/B rules (사용자 정의 룰)
 # -----------------------------
 def _sign_score(x: float, eps: float = 1e-6) -> int:
-    if pd.isna(x):
+    if x is None or x != x:
         return 0
     if x > eps:
         return 1
@@ -276,19 +506,33 @@ def _bucket_range_5(score: float) -> str:
     return f"{lo}~{lo+5}"
 
 
-def _to_opinion(score: float) -> str:
+def _to_signal(score: float) -> int:
+    # 의견을 정수(+1 매수 / 0 중립 / -1 매도)로 → 최종 의견은 문자열 비교 없이 정수 비교
     if score >= 1.0:
-        return "매수"
+        return 1
     if score <= -1.0:
-        return "매도"
-    return "중립"
+        return -1
+    return 0
+
+
+def _recent_returns(df: pd.DataFrame, valid: frozenset[str]) -> tuple[float, float]:
+    """
+    index_close 기준 3D/5D 수익률
+    - 마지막 값만 필요하므로 pct_change 전체 Series 대신 NumPy 인덱싱
+    """
+    if "index_close" not in valid:
+        return np.nan, np.nan
+    close = df["index_close"].to_numpy(dtype=np.float64)
+    ret3 = float(close[-1] / close[-4] - 1.0) if len(close) >= 4 else np.nan
+    ret5 = float(close[-1] / close[-6] - 1.0) if len(close) >= 6 else np.nan
+    return ret3, ret5
 
 
-def _compute_strategy_AB(df: pd.DataFrame, eps_flat: float = 0.002) -> dict:
+def _compute_strategy_AB(df: pd.DataFrame, ret3: float, ret5: float, eps_flat: float = 0.002) -> dict:
     """
     사용자 정의 A/B 룰 구현
-    - score: fear_greed_1y_rescaled (없으면 fear_greed)
-    - 3D/5D: index_close pct_change(3/5)
+    - score: fear_greed_1y_rescaled (최신 값 없으면 fear_greed)
+    - 3D/5D: index_close 3D/5D 수익률 (_recent_returns)
 
     A안:
       - base: 40/60
@@ -298,13 +542,8 @@ def _compute_strategy_AB(df: pd.DataFrame, eps_flat: float = 0.002) -> dict:
       - base: 45/55
       - adj: 5D(+1/-1) + 3D * 0.25
     """
-    last = df.iloc[-1]
-
-    score = float(last["fear_greed_1y_rescaled"]) if _safe_col(df, "fear_greed_1y_rescaled") else float(last["fear_greed"])
-    idx = df["index_close"] if _safe_col(df, "index_close") else pd.Series([np.nan] * len(df))
-
-    ret3 = float(idx.pct_change(3).iloc[-1]) if len(idx) > 3 else np.nan
-    ret5 = float(idx.pct_change(5).iloc[-1]) if len(idx) > 5 else np.nan
+    score_col = "fear_greed_1y_rescaled" if _has_last(df, "fear_greed_1y_rescaled") else "fear_greed"
+    score = float(df[score_col].iloc[-1])
 
     # --- A안
     if score < 40:
@@ -315,11 +554,11 @@ def _compute_strategy_AB(df: pd.DataFrame, eps_flat: float = 0.002) -> dict:
         base_A = 1
 
     adj_A = 0.0
-    if not pd.isna(ret5) and abs(ret5) > eps_flat:
+    if ret5 == ret5 and abs(ret5) > eps_flat:
         adj_A = 1.0 if ret5 > 0 else -1.0
         trend_reason_A = "5D 우선"
     else:
-        if not pd.isna(ret3) and abs(ret3) > eps_flat:
+        if ret3 == ret3 and abs(ret3) > eps_flat:
             adj_A = 0.5 if ret3 > 0 else -0.5
             trend_reason_A = "5D 보합 → 3D 반영"
         else:
@@ -327,6 +566,7 @@ def _compute_strategy_AB(df: pd.DataFrame, eps_flat: float = 0.002) -> dict:
             trend_reason_A = "5D/3D 보합"
 
     score_A = base_A + adj_A
+    signal_A = _to_signal(score_A)
 
     # --- B안
     if score < 45:
@@ -344,6 +584,7 @@ def _compute_strategy_AB(df: pd.DataFrame, eps_flat: float = 0.002) -> dict:
     adj_B += 0.25 * float(s3)
 
     score_B = base_B + adj_B
+    signal_B = _to_signal(score_B)
 
     return {
         "score": score,
@@ -354,42 +595,39 @@ def _compute_strategy_AB(df: pd.DataFrame, eps_flat: float = 0.002) -> dict:
             "base": base_A,
             "adj": adj_A,
             "score": score_A,
-            "opinion": _to_opinion(score_A),
+            "signal": signal_A,
+            "opinion": OPINION_LABELS[signal_A],
             "note": f"A안: base(40/60)={base_A}, adj={adj_A:+.2f} ({trend_reason_A})",
         },
         "B": {
             "base": base_B,
             "adj": adj_B,
             "score": score_B,
-            "opinion": _to_opinion(score_B),
+            "signal": signal_B,
+            "opinion": OPINION_LABELS[signal_B],
             "note": f"B안: base(45/55)={base_B}, adj=5D({s5:+d})+3D({s3:+d})*0.25 → {adj_B:+.2f}",
         },
     }
 
 
-def _strategy_payload_for_html(df: pd.DataFrame) -> dict:
+def _strategy_payload_for_html(df: pd.DataFrame, ret3: float, ret5: float) -> dict:
     """
     HTML 표시용으로 A/B를 'action/text/final' 형태로 변환
     """
-    ab = _compute_strategy_AB(df)
+    ab = _compute_strategy_AB(df, ret3, ret5)
 
     # 최종 의견: 보수적으로 "둘 다 매수면 매수, 둘 다 매도면 매도, 그 외 중립"
-    a_op = ab["A"]["opinion"]
-    b_op = ab["B"]["opinion"]
-    if a_op == "매수" and b_op == "매수":
-        final = "매수"
-    elif a_op == "매도" and b_op == "매도":
-        final = "매도"
-    else:
-        final = "중립"
+    a_sig = ab["A"]["signal"]
+    b_sig = ab["B"]["signal"]
+    final = OPINION_LABELS[a_sig if a_sig == b_sig else 0]
 
     return {
         "A": {
-            "action": a_op,
+            "action": ab["A"]["opinion"],
             "text": f"{ab['A']['note']} / 점수={ab['A']['score']:+.2f}",
         },
         "B": {
-            "action": b_op,
+            "action": ab["B"]["opinion"],
             "text": f"{ab['B']['note']} / 점수={ab['B']['score']:+.2f}",
         },
         "final": final,
@@ -399,7 +637,7 @@ def _strategy_payload_for_html(df: pd.DataFrame) -> dict:
 # -----------------------------
 # Report index (최근 10개)
 # -----------------------------
-def _update_report_index(new_dated_file: str, asof: str) -> dict:
+def _update_report_index(new_dated_file: str, asof: str, built_utc: str) -> dict:
     """
     docs/report_index.json 생성/갱신:
     - 최근 10개 날짜 파일 목록
@@ -417,58 +655,27 @@ def _update_report_index(new_dated_file: str, asof: str) -> dict:
     items = items[:10]
 
     payload = {
-        "updated_utc": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S"),
+        "updated_utc": built_utc,
         "latest_asof": asof,
         "items": items,
     }
-    REPORT_INDEX_JSON.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    # HTML과 동일하게 미리 인코딩한 바이트로 기록 (텍스트 래퍼/개행 변환 없음)
+    REPORT_INDEX_JSON.write_bytes(json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8"))
     return payload
 
 
 # -----------------------------
 # HTML builder (Genspark-like)
 # -----------------------------
-def _build_html(asof: str, kpi: dict, strategy: dict, img: dict, fwd_table_html: str) -> str:
-    kpi_html = f"""
-    <div class="kpi-grid">
-      <div class="kpi-card">
-        <div class="kpi-label">곰탕 지수값(1Y)</div>
-        <div class="kpi-value">{_fmt_num(kpi["fg"], 2)}</div>
-        <div class="kpi-sub">0~100</div>
-      </div>
-      <div class="kpi-card">
-        <div class="kpi-label">구간(정체)</div>
-        <div class="kpi-value">{kpi["bucket_range"]}</div>
-        <div class="kpi-sub">{kpi["bucket_name"]}</div>
-      </div>
-      <div class="kpi-card">
-        <div class="kpi-label">추세(+5p)</div>
-        <div class="kpi-pills">
-          <span class="pill">3D: {_fmt_pct(kpi["ret3"])}</span>
-          <span class="pill">5D: {_fmt_pct(kpi["ret5"])}</span>
-        </div>
-        <div class="kpi-sub">* index_close 기반</div>
-      </div>
-      <div class="kpi-card">
-        <div class="kpi-label">KOSPI200</div>
-        <div class="kpi-pills">
-          <span class="pill">종가: {_fmt_num(kpi["index_close"], 2)}</span>
-          <span class="pill">3D: {_fmt_pct(kpi["ret3"])}</span>
-          <span class="pill">5D: {_fmt_pct(kpi["ret5"])}</span>
-        </div>
-        <div class="kpi-sub">단기 변화율</div>
-      </div>
-    </div>
-    """
-
-    html = f"""<!doctype html>
+_HTML_HEAD = """<!doctype html>
 <html lang="ko">
 <head>
   <meta charset="utf-8" />
   <meta name="viewport" content="width=device-width, initial-scale=1" />
   <title>곰탕지수 리포트</title>
-  <style>
-    :root {{
+"""
+
+_CSS = """    :root {
       --bg: #0b1020;
       --panel: #0f1a30;
       --card: #111f3a;
@@ -476,107 +683,107 @@ def _build_html(asof: str, kpi: dict, strategy: dict, img: dict, fwd_table_html:
       --text: #e8eefc;
       --muted: rgba(232,238,252,0.72);
       --accent: #66a6ff;
-    }}
-    body {{
+    }
+    body {
       margin:0; background: var(--bg); color: var(--text);
       font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Noto Sans KR", Arial, sans-serif;
-    }}
-    .topbar {{
+    }
+    .topbar {
       display:flex; justify-content:space-between; align-items:center;
       padding: 10px 14px; border-bottom: 1px solid var(--line);
       background: rgba(15,26,48,0.85);
       position: sticky; top: 0; backdrop-filter: blur(10px); z-index: 10;
-    }}
-    .brand {{ font-weight: 700; font-size: 14px; color: var(--text); opacity:0.95; }}
-    .toolbar {{ display:flex; gap:8px; align-items:center; }}
-    select, button {{
+    }
+    .brand { font-weight: 700; font-size: 14px; color: var(--text); opacity:0.95; }
+    .toolbar { display:flex; gap:8px; align-items:center; }
+    select, button {
       background: #0e1a33; color: var(--text);
       border: 1px solid var(--line);
       border-radius: 10px; padding: 8px 10px; font-size: 12px;
-    }}
-    button {{ cursor:pointer; }}
-    .container {{ max-width: 1200px; margin: 0 auto; padding: 14px; }}
-    .hero {{
+    }
+    button { cursor:pointer; }
+    .container { max-width: 1200px; margin: 0 auto; padding: 14px; }
+    .hero {
       background: radial-gradient(1200px 400px at 30% 0%, rgba(102,166,255,0.20), transparent 60%),
                   radial-gradient(900px 300px at 80% 30%, rgba(77,212,172,0.15), transparent 65%);
       border: 1px solid var(--line);
       border-radius: 16px;
       padding: 16px;
       margin-top: 10px;
-    }}
-    .title-row {{ display:flex; align-items:baseline; gap:10px; flex-wrap:wrap; }}
-    h1 {{ margin:0; font-size: 22px; }}
-    .badge {{
+    }
+    .title-row { display:flex; align-items:baseline; gap:10px; flex-wrap:wrap; }
+    h1 { margin:0; font-size: 22px; }
+    .badge {
       display:inline-block; padding: 4px 10px; border-radius: 999px;
       border: 1px solid var(--line); background: rgba(255,255,255,0.04);
       font-size: 12px; color: var(--text);
-    }}
+    }
 
-    .kpi-grid {{
+    .kpi-grid {
       margin-top: 14px;
       display:grid; grid-template-columns: repeat(4, 1fr); gap: 12px;
-    }}
-    @media (max-width: 980px) {{
-      .kpi-grid {{ grid-template-columns: repeat(2, 1fr); }}
-    }}
-    @media (max-width: 520px) {{
-      .kpi-grid {{ grid-template-columns: 1fr; }}
-    }}
-    .kpi-card {{
+    }
+    @media (max-width: 980px) {
+      .kpi-grid { grid-template-columns: repeat(2, 1fr); }
+    }
+    @media (max-width: 520px) {
+      .kpi-grid { grid-template-columns: 1fr; }
+    }
+    .kpi-card {
       background: rgba(17,31,58,0.85);
       border: 1px solid var(--line);
       border-radius: 14px;
       padding: 12px;
       min-height: 84px;
-    }}
-    .kpi-label {{ font-size: 12px; color: var(--muted); margin-bottom: 6px; }}
-    .kpi-value {{ font-size: 20px; font-weight: 800; }}
-    .kpi-sub {{ margin-top: 6px; font-size: 12px; color: var(--muted); }}
-    .kpi-pills {{ display:flex; flex-wrap:wrap; gap:6px; }}
-    .pill {{
+    }
+    .kpi-label { font-size: 12px; color: var(--muted); margin-bottom: 6px; }
+    .kpi-value { font-size: 20px; font-weight: 800; }
+    .kpi-sub { margin-top: 6px; font-size: 12px; color: var(--muted); }
+    .kpi-pills { display:flex; flex-wrap:wrap; gap:6px; }
+    .pill {
       font-size: 12px;
       padding: 4px 8px;
       border-radius: 999px;
       border: 1px solid var(--line);
       background: rgba(255,255,255,0.04);
-    }}
+    }
 
-    .section {{
+    .section {
       margin-top: 14px;
       border: 1px solid var(--line);
       border-radius: 16px;
       background: rgba(15,26,48,0.55);
       padding: 12px;
-    }}
-    .section h2 {{ margin: 0 0 10px 0; font-size: 15px; }}
-    .grid2 {{ display:grid; grid-template-columns: 1.1fr 0.9fr; gap: 12px; }}
-    @media (max-width: 980px) {{ .grid2 {{ grid-template-columns: 1fr; }} }}
+    }
+    .section h2 { margin: 0 0 10px 0; font-size: 15px; }
+    .grid2 { display:grid; grid-template-columns: 1.1fr 0.9fr; gap: 12px; }
+    @media (max-width: 980px) { .grid2 { grid-template-columns: 1fr; } }
 
-    .card {{
+    .card {
       border: 1px solid var(--line);
       background: rgba(17,31,58,0.75);
       border-radius: 14px;
       padding: 12px;
-    }}
-    .card h3 {{ margin: 0 0 10px 0; font-size: 14px; color: rgba(232,238,252,0.95); }}
+    }
+    .card h3 { margin: 0 0 10px 0; font-size: 14px; color: rgba(232,238,252,0.95); }
 
-    img {{ width: 100%; height: auto; border-radius: 12px; border: 1px solid rgba(255,255,255,0.06); }}
+    img { width: 100%; height: auto; border-radius: 12px; border: 1px solid rgba(255,255,255,0.06); }
 
-    table {{ width:100%; border-collapse: collapse; }}
-    th, td {{ border-bottom: 1px solid rgba(255,255,255,0.10); padding: 7px 9px; font-size: 12px; }}
-    th {{ text-align:left; color: rgba(232,238,252,0.92); background: rgba(255,255,255,0.03); }}
+    table { width:100%; border-collapse: collapse; }
+    th, td { border-bottom: 1px solid rgba(255,255,255,0.10); padding: 7px 9px; font-size: 12px; }
+    th { text-align:left; color: rgba(232,238,252,0.92); background: rgba(255,255,255,0.03); }
 
-    .muted {{ color: var(--muted); font-size: 12px; line-height: 1.6; }}
-    .ab-grid {{ display:grid; grid-template-columns: 1fr 1fr; gap: 10px; }}
-    @media (max-width: 980px) {{ .ab-grid {{ grid-template-columns: 1fr; }} }}
-    .ab-box {{
+    .muted { color: var(--muted); font-size: 12px; line-height: 1.6; }
+    .ab-grid { display:grid; grid-template-columns: 1fr 1fr; gap: 10px; }
+    @media (max-width: 980px) { .ab-grid { grid-template-columns: 1fr; } }
+    .ab-box {
       border: 1px solid var(--line);
       background: rgba(255,255,255,0.03);
       border-radius: 14px;
       padding: 12px;
-    }}
-    .ab-title {{ font-weight: 800; margin-bottom: 8px; }}
-    .ab-final {{
+    }
+    .ab-title { font-weight: 800; margin-bottom: 8px; }
+    .ab-final {
       margin-top: 8px;
       display:inline-block;
       padding: 4px 10px;
@@ -584,11 +791,62 @@ def _build_html(asof: str, kpi: dict, strategy: dict, img: dict, fwd_table_html:
       background: rgba(102,166,255,0.15);
       border: 1px solid rgba(102,166,255,0.35);
       font-size: 12px;
-    }}
-  </style>
-</head>
-<body>
-  <div class="topbar">
+    }
+"""
+
+_SCRIPT = """async function initDates() {
+  const res = await fetch('report_index.json?ts=' + Date.now());
+  const data = await res.json();
+  const sel = document.getElementById('dateSelect');
+  sel.innerHTML = '';
+  (data.items || []).forEach((it, idx) => {
+    const opt = document.createElement('option');
+    opt.value = it.file;
+    opt.textContent = it.asof + (idx===0 ? ' (최신)' : '');
+    sel.appendChild(opt);
+  });
+  sel.onchange = () => {
+    window.location.href = sel.value;
+  };
+}
+initDates();
+"""
+
+
+def _build_html(asof: str, kpi: dict, strategy: dict, img: dict, fwd_table_html: str, built_utc: str) -> str:
+    kpi_html = f"""
+    <div class="kpi-grid">
+      <div class="kpi-card">
+        <div class="kpi-label">곰탕 지수값(1Y)</div>
+        <div class="kpi-value">{_fmt_num(kpi["fg"], 2)}</div>
+        <div class="kpi-sub">0~100</div>
+      </div>
+      <div class="kpi-card">
+        <div class="kpi-label">구간(정체)</div>
+        <div class="kpi-value">{kpi["bucket_range"]}</div>
+        <div class="kpi-sub">{kpi["bucket_name"]}</div>
+      </div>
+      <div class="kpi-card">
+        <div class="kpi-label">추세(+5p)</div>
+        <div class="kpi-pills">
+          <span class="pill">3D: {_fmt_pct(kpi["ret3"])}</span>
+          <span class="pill">5D: {_fmt_pct(kpi["ret5"])}</span>
+        </div>
+        <div class="kpi-sub">* index_close 기반</div>
+      </div>
+      <div class="kpi-card">
+        <div class="kpi-label">KOSPI200</div>
+        <div class="kpi-pills">
+          <span class="pill">종가: {_fmt_num(kpi["index_close"], 2)}</span>
+          <span class="pill">3D: {_fmt_pct(kpi["ret3"])}</span>
+          <span class="pill">5D: {_fmt_pct(kpi["ret5"])}</span>
+        </div>
+        <div class="kpi-sub">단기 변화율</div>
+      </div>
+    </div>
+    """
+
+    body = f"""  <div class="topbar">
     <div class="brand">곰탕지수 리포트</div>
     <div class="toolbar">
       <select id="dateSelect" title="날짜 선택(최근 10개)"></select>
@@ -604,7 +862,7 @@ def _build_html(asof: str, kpi: dict, strategy: dict, img: dict, fwd_table_html:
         <span class="badge">{asof}</span>
       </div>
       <div class="muted" style="margin-top:8px;">
-        * GitHub Actions가 레포 <code>data/</code>를 읽어서 매일 자동 생성합니다. (UTC 생성시각: {datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")})
+        * GitHub Actions가 레포 <code>data/</code>를 읽어서 매일 자동 생성합니다. (UTC 생성시각: {built_utc})
       </div>
 
       {kpi_html}
@@ -659,49 +917,39 @@ def _build_html(asof: str, kpi: dict, strategy: dict, img: dict, fwd_table_html:
     </div>
   </div>
 
-<script>
-async function initDates() {{
-  const res = await fetch('report_index.json?ts=' + Date.now());
-  const data = await res.json();
-  const sel = document.getElementById('dateSelect');
-  sel.innerHTML = '';
-  (data.items || []).forEach((it, idx) => {{
-    const opt = document.createElement('option');
-    opt.value = it.file;
-    opt.textContent = it.asof + (idx===0 ? ' (최신)' : '');
-    sel.appendChild(opt);
-  }});
-  sel.onchange = () => {{
-    window.location.href = sel.value;
-  }};
-}}
-initDates();
-</script>
-</body>
-</html>"""
-    return html
+"""
+
+    # 정적 CSS/JS는 모듈 상수, 동적 부분만 f-string → 리스트로 모아 한 번에 join
+    parts = [
+        _HTML_HEAD,
+        "  <style>\n", _CSS, "  </style>\n",
+        "</head>\n<body>\n",
+        body,
+        "<script>\n", _SCRIPT, "</script>\n",
+        "</body>\n</html>",
+    ]
+    return "".join(parts)
 
 
 def main():
     _ensure_dirs()
 
-    df = _read_fg()
+    df, valid = _read_fg()
 
     # as-of date
     asof_dt = df["date"].iloc[-1]
     asof = asof_dt.strftime("%Y-%m-%d")
 
     # KPI 계산 (FG + bucket range + index close + 3D/5D)
-    fg_val = float(df["fear_greed_1y_rescaled"].iloc[-1]) if _safe_col(df, "fear_greed_1y_rescaled") else float(df["fear_greed"].iloc[-1])
-    bucket_name = str(df["fg_bucket_1y"].iloc[-1]) if _safe_col(df, "fg_bucket_1y") else "NA"
+    fg_val = float(df["fear_greed_1y_rescaled"].iloc[-1]) if _has_last(df, "fear_greed_1y_rescaled") else float(df["fear_greed"].iloc[-1])
+    bucket_name = str(df["fg_bucket_1y"].iloc[-1]) if _has_last(df, "fg_bucket_1y") else "NA"
 
     lo = int(np.floor(fg_val / 5) * 5)
     hi = int(lo + 5)
     bucket_range = f"{lo}~{hi}"
 
-    index_close = float(df["index_close"].iloc[-1]) if _safe_col(df, "index_close") else np.nan
-    ret3 = float(df["index_close"].pct_change(3).iloc[-1]) if _safe_col(df, "index_close") else np.nan
-    ret5 = float(df["index_close"].pct_change(5).iloc[-1]) if _safe_col(df, "index_close") else np.nan
+    index_close = float(df["index_close"].iloc[-1]) if _has_last(df, "index_close") else np.nan
+    ret3, ret5 = _recent_returns(df, valid)
 
     kpi = {
         "fg": fg_val,
@@ -713,48 +961,66 @@ def main():
     }
 
     # ✅ 투자전략(A/B 룰) — _strategy_rules 호출 제거 (0개)
-    strategy = _strategy_payload_for_html(df)
+    strategy = _strategy_payload_for_html(df, ret3, ret5)
 
     # Charts
-    fg_line_png = ASSETS_DIR / "fg_line.png"
-    comps_png = ASSETS_DIR / "components_grid.png"
-    heat_mean_png = ASSETS_DIR / "heat_mean_20d.png"
-    heat_win_png = ASSETS_DIR / "heat_win_20d.png"
+    fg_line_svg = ASSETS_DIR / "fg_line.svg"
+    comps_svg = ASSETS_DIR / "components_grid.svg"
+    heat_mean_img = ASSETS_DIR / "heat_mean_20d.webp"
+    heat_win_img = ASSETS_DIR / "heat_win_20d.webp"
+
+    # 파일 생성
+    dated_file = f"곰탕지수_1Y리스케일_{asof}_embedded.html"
+    latest_file = "곰탕지수_1Y리스케일_latest_embedded.html"
 
-    _fig_fg_line(df, fg_line_png)
-    _fig_components_grid(df, comps_png)
+    # 생성시각은 1회만 캡처 → report_index.json / HTML 동일 값
+    built_utc = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
 
-    pivot_mean, pivot_win, latest_cell = _make_heatmap_tables(df)
-    _fig_heatmap(pivot_mean, heat_mean_png, "평균 수익(20D) — Bucket x 추세(5D)", fmt=".3f", center=0.0, latest_cell=latest_cell)
-    _fig_heatmap(pivot_win, heat_win_png, "승률(20D) — Bucket x 추세(5D)", fmt=".2f", center=None, latest_cell=latest_cell)
+    # 차트 4개 순차 렌더링 (공용 Figure 재사용)
+    fig = _get_fig()
+    pivot_mean, pivot_win, latest_cell = _make_heatmap_tables(df, valid)
+    _fig_fg_line(df, valid, fg_line_svg, fig=fig)
+    _fig_components_grid(df, valid, comps_svg, fig=fig)
+    _fig_heatmap(pivot_mean, heat_mean_img, "평균 수익(20D) — Bucket x 추세(5D)", fmt=".3f", center=0.0, latest_cell=latest_cell, fig=fig)
+    _fig_heatmap(pivot_win, heat_win_img, "승률(20D) — Bucket x 추세(5D)", fmt=".2f", center=None, latest_cell=latest_cell, fig=fig)
 
     img = {
-        "fg_line": f"assets/{fg_line_png.name}",
-        "components": f"assets/{comps_png.name}",
-        "heat_mean": f"assets/{heat_mean_png.name}",
-        "heat_win": f"assets/{heat_win_png.name}",
+        "fg_line": f"assets/{fg_line_svg.name}",
+        "components": f"assets/{comps_svg.name}",
+        "heat_mean": f"assets/{heat_mean_img.name}",
+        "heat_win": f"assets/{heat_win_img.name}",
     }
 
     # forward summary table
     fwd_table_html = _read_forward_summary_table_html()
 
-    # 파일 생성
-    dated_file = f"곰탕지수_1Y리스케일_{asof}_embedded.html"
-    latest_file = "곰탕지수_1Y리스케일_latest_embedded.html"
-
-    _update_report_index(dated_file, asof)
-
     html = _build_html(
         asof=asof,
         kpi=kpi,
         strategy=strategy,
         img=img,
         fwd_table_html=fwd_table_html,
+        built_utc=built_utc,
     )
 
-    (DOCS_DIR / dated_file).write_text(html, encoding="utf-8")
-    (DOCS_DIR / latest_file).write_text(html, encoding="utf-8")
-    (DOCS_DIR / "index.html").write_text(html, encoding="utf-8")
+    _update_report_index(dated_file, asof, built_utc)
+
+    # 인코딩/기록은 1회만, latest/index는 하드링크 (링크 불가 FS면 바이트 복사)
+    # 모두 임시 이름에 만든 뒤 os.replace → 교체 중에도 index.html이 비거나 사라지는 순간 없음
+    # (날짜 파일도 새 inode로 교체: 기존 링크 파일을 제자리에서 truncate하지 않음)
+    data = memoryview(html.encode("utf-8"))
+    dated_path = DOCS_DIR / dated_file
+    tmp = dated_path.with_name(f".{dated_file}.tmp")
+    _write_fd(tmp, data)
+    os.replace(tmp, dated_path)
+    for target in (DOCS_DIR / latest_file, DOCS_DIR / "index.html"):
+        tmp = target.with_name(f".{target.name}.tmp")
+        tmp.unlink(missing_ok=True)
+        try:
+            os.link(dated_path, tmp)
+        except OSError:
+            _write_fd(tmp, data)
+        os.replace(tmp, target)
 
     print("[OK] wrote reports:")
     print(" -", DOCS_DIR / dated_file)